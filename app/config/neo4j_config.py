@@ -1,4 +1,7 @@
-import requests
+import gzip
+import httpx
+import orjson
+from typing import Optional
 from .settings import settings
 import logging
 from fastapi import HTTPException
@@ -7,45 +10,79 @@ logger = logging.getLogger(__name__)
 
 class Neo4jConnection:
     def __init__(self):
-        self.base_url = "https://7035b473.databases.neo4j.io/db/neo4j/query/v2"
+        # Transactional HTTP endpoint: accepts several statements per request and commits them together
+        self.base_url = f"https://7035b473.databases.neo4j.io/db/{settings.NEO4J_DATABASE}/tx/commit"
         self.auth = (settings.NEO4J_USER, settings.NEO4J_PASSWORD)
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
             "X-Stream": "true"
         }
+        self.client: Optional[httpx.AsyncClient] = None
         logger.info(f"Neo4j HTTP API initialized with URL: {self.base_url}")
 
-    def execute_query(self, query, params=None):
+    async def connect(self):
+        # One HTTP/2 client per process: queries multiplex over a kept-alive TLS connection
+        if self.client is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+            self.client = httpx.AsyncClient(
+                transport=transport,
+                timeout=30.0,
+                auth=self.auth,
+                headers=self.headers
+            )
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    async def execute_query(self, query, params=None):
+        results = await self.execute_queries([(query, params)])
+        return results[0]
+
+    async def execute_queries(self, queries):
+        # Send several statements in a single HTTP round-trip; returns one record list per statement
         try:
             # Format query according to Neo4j HTTP API specs
             payload = {
                 "statements": [
                     {
                         "statement": query,
-                        "parameters": {},
+                        "parameters": params or {},
                         "resultDataContents": ["row"],
                         "includeStats": True
                     }
+                    for query, params in queries
                 ]
             }
 
-            logger.info(f"Sending query to Neo4j: {query}")
-            logger.info(f"With payload: {payload}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending %d queries to Neo4j: %s", len(queries), [query for query, _ in queries])
             
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                auth=self.auth,
-                headers=self.headers,
-                timeout=30
-            )
+            if self.client is None:
+                await self.connect()
+
+            # Compress large request bodies; responses are decompressed by httpx
+            body = orjson.dumps(payload)
+            headers = None
+            if 0 < settings.NEO4J_HTTP_GZIP_MIN_SIZE <= len(body):
+                body = gzip.compress(body)
+                headers = {"Content-Encoding": "gzip"}
+
+            response = await self.client.post(self.base_url, content=body, headers=headers)
 
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response body: {response.text}")
+            logger.debug("Response status: %s", response.status_code)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response body: %s", response.text)
 
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 
                 # Check for Neo4j errors
                 if result.get("errors") and len(result["errors"]) > 0:
@@ -54,21 +91,24 @@ class Neo4jConnection:
                     logger.error(error_msg)
                     raise HTTPException(status_code=400, detail=error_msg)
 
-                # Extract results
-                if result.get("results") and len(result["results"]) > 0:
-                    first_result = result["results"][0]
-                    if "data" not in first_result:
-                        return []
-                        
+                # Extract results, one entry per statement in request order
+                results = []
+                for statement_result in result.get("results", []):
                     records = []
-                    for item in first_result["data"]:
+                    for item in statement_result.get("data", []):
                         if "row" in item and len(item["row"]) > 0:
                             # Each row is an array of values
                             records.append(item["row"][0])
-                    
-                    logger.info(f"Query returned {len(records)} records")
-                    return records
-                return []
+                    results.append(records)
+
+                if len(results) != len(queries):
+                    error_msg = f"Neo4j returned {len(results)} results for {len(queries)} statements"
+                    logger.error(error_msg)
+                    raise HTTPException(status_code=500, detail=error_msg)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Queries returned %s records", [len(records) for records in results])
+                return results
 
             else:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
@@ -78,7 +118,9 @@ class Neo4jConnection:
                     detail=error_msg
                 )
 
-        except requests.exceptions.RequestException as e:
+        except HTTPException:
+            raise
+        except httpx.HTTPError as e:
             error_msg = f"Request failed: {str(e)}"
             logger.error(error_msg)
             raise HTTPException(status_code=500, detail=error_msg)
@@ -9,6 +9,7 @@ class Settings(BaseSettings):
     # API Settings
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "PoliDoc API"
+    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     
     # CORS Settings
     BACKEND_CORS_ORIGINS: list = ["*"]
@@ -21,6 +22,23 @@ class Settings(BaseSettings):
     NEO4J_URI: str = os.getenv("NEO4J_URI", "")
     NEO4J_USER: str = os.getenv("NEO4J_USER", "")
     NEO4J_PASSWORD: str = os.getenv("NEO4J_PASSWORD", "")
+    NEO4J_DATABASE: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0
+    NEO4J_MAX_CONNECTION_LIFETIME: int = 3600
+    NEO4J_MAX_TRANSACTION_RETRY_TIME: float = 15.0
+    NEO4J_HTTP_GZIP_MIN_SIZE: int = 1024
+
+    # Graph query cache settings
+    GRAPH_CACHE_MAXSIZE: int = 256
+    GRAPH_CACHE_TTL: int = 300
+    # Required in the X-Admin-Token header to clear the cache; the route is disabled when empty
+    GRAPH_ADMIN_TOKEN: str = os.getenv("GRAPH_ADMIN_TOKEN", "")
+
+    # Request batching settings. Same-key policy-type lookups are already serialised by the cache lock,
+    # so batching only merges distinct keys; in exchange every cold lookup waits up to MAX_QUEUE_TIME.
+    GRAPH_BATCH_MAX_SIZE: int = 64
+    GRAPH_BATCH_MAX_QUEUE_TIME: float = 0.005
     
     class Config:
         case_sensitive = True
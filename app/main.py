@@ -1,31 +1,44 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 from app.routers import graph
-import os
-from dotenv import load_dotenv
+from app.config.neo4j_config import neo4j_connection
+from app.config.settings import settings
 
-# Load environment variables
-load_dotenv()
+# Neo4j driver and HTTP client lifecycle: one pooled instance of each per process.
+# The HTTP client is opened lazily on first use, so only its close() lives here.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    graph.attach_neo4j(app.state, await graph.create_neo4j_driver())
+    try:
+        yield
+    finally:
+        await app.state.neo4j_driver.close()
+        await neo4j_connection.close()
 
 app = FastAPI(
-    title="PoliDoc API",
+    title=settings.PROJECT_NAME,
     description="API for insurance policy document management and analysis",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
+    allow_origins=settings.BACKEND_CORS_ORIGINS,  # In production, replace with specific origins
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 # Include routers
-app.include_router(graph.router, prefix="/api/v1/graph", tags=["graph"])
+app.include_router(graph.router, prefix=f"{settings.API_V1_STR}/graph", tags=["graph"])
 
 # Health check endpoint
 @app.get("/health")
@@ -33,7 +46,18 @@ async def health_check():
     return {
         "status": "healthy",
         "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "environment": settings.ENVIRONMENT
     }
 
-
+# Neo4j liveness probe; connectivity is only verified here and at startup, never per request
+@app.get("/health/neo4j")
+async def neo4j_health_check(request: Request):
+    try:
+        await graph.probe(await graph.get_neo4j_driver(request))
+        return {"status": "healthy"}
+    except Exception as e:
+        logger.error(f"Neo4j health check failed: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Neo4j unavailable: {str(e)}"
+        )
@@ -1,65 +1,495 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Final, Tuple
+from cachetools import TTLCache
+import asyncio
+import secrets
 from loguru import logger
-from neo4j import GraphDatabase
-import os
-from dotenv import load_dotenv
+import orjson
+from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncResult, READ_ACCESS, RoutingControl
 from pydantic import BaseModel
+from app.config.settings import settings
+from app.utils.batcher import AsyncBatcher
 
-# Load environment variables
-load_dotenv()
+# Render graph responses with orjson even if the router is mounted on an app with a different default
+router = APIRouter(default_response_class=ORJSONResponse)
 
-router = APIRouter()
+_DB = settings.NEO4J_DATABASE
 
-def get_neo4j_driver():
-    uri = os.getenv("NEO4J_URI")
-    user = os.getenv("NEO4J_USER")
-    password = os.getenv("NEO4J_PASSWORD")
-    database = os.getenv("NEO4J_DATABASE", "neo4j")
-    
+# Cypher queries, built once at import and shared by every request
+_Q_FORMS: Final[str] = """
+MATCH (n:Form)
+RETURN n.State AS State,
+       n.Form_Type AS Form_Type,
+       n.Form_Name AS Form_Name,
+       n.Form_Number AS Form_Number
+"""
+
+_Q_POLICY_TYPE_LABELS: Final[str] = """
+CALL db.schema.nodeTypeProperties()
+YIELD nodeLabels, propertyName
+WHERE propertyName = 'Policy_Type'
+UNWIND nodeLabels AS label
+RETURN DISTINCT label
+"""
+
+_Q_POLICY_TYPE_REL_TYPES: Final[str] = """
+CALL db.schema.relTypeProperties()
+YIELD relType, propertyName
+WHERE propertyName = 'Policy_Type'
+RETURN DISTINCT substring(relType, 2, size(relType) - 3) AS rel_type
+"""
+
+_Q_COVERAGES: Final[str] = """
+MATCH (n:Coverage)
+RETURN n.Coverage AS coverage,
+       n.Cov_For AS cov_for,
+       n.Description AS description
+LIMIT 25
+"""
+
+_Q_FORM_POLICY_TYPES_BATCH: Final[str] = """
+UNWIND $form_numbers AS form_number
+OPTIONAL MATCH (f:Form)
+WHERE f.Form_Number = form_number
+RETURN form_number, head(collect(f.Form_Type)) AS policy_type
+"""
+
+_Q_FORM_COVERAGES: Final[str] = """
+MATCH(p:Paragraph)-[y:Related_Coverage]-(c:Coverage)
+WHERE p.Policy_Form = $form_number
+RETURN DISTINCT c.Coverage as coverage_code, c.Cov_For as coverage_name
+ORDER BY c.Coverage
+"""
+
+_Q_FORM_SUMMARY: Final[str] = """
+MATCH (f:Form)
+WHERE f.Form_Number = $form_number
+OPTIONAL MATCH (p:Paragraph)-[:Related_Coverage]-(c:Coverage)
+WHERE p.Policy_Form = $form_number
+WITH f, c
+ORDER BY c.Coverage
+WITH f, collect(DISTINCT {coverage_code: c.Coverage, coverage_name: c.Cov_For}) AS coverages
+RETURN f.Form_Type AS policy_type,
+       [coverage IN coverages WHERE coverage.coverage_code IS NOT NULL] AS coverages
+"""
+
+_Q_COVERAGE_TERMS_KEYED: Final[str] = """
+UNWIND $keys AS key
+CALL {
+    WITH key
+    MATCH (m:Map_Term)-[x:Maps_To]-(p:Paragraph)-[y:Related_Coverage]-(c:Coverage)
+    WHERE p.Policy_Form = key.form_number
+    AND x.Map_Type <> 'None'
+    AND c.Coverage = key.coverage_code
+    AND p.Type <> 'Section Title'
+    AND p.Type <> 'Subsection Title'
+    WITH DISTINCT c.Coverage as coverage_code,
+                  x.Map_Type as map_type,
+                  m.Term as term
+    ORDER BY coverage_code, map_type, term
+    SKIP $offset
+    RETURN collect({coverage_code: coverage_code, map_type: map_type, term: term}) AS terms
+}
+RETURN key.id AS id, terms
+"""
+
+# Paged variant, used only when the client passes `limit`
+_Q_COVERAGE_TERMS_KEYED_PAGE: Final[str] = _Q_COVERAGE_TERMS_KEYED.replace(
+    "    SKIP $offset\n", "    SKIP $offset\n    LIMIT $limit\n"
+)
+
+_Q_COVERAGE_TERMS_BATCH: Final[str] = """
+UNWIND $coverage_codes AS code
+MATCH (m:Map_Term)-[x:Maps_To]-(p:Paragraph)-[y:Related_Coverage]-(c:Coverage)
+WHERE p.Policy_Form = $form_number
+AND x.Map_Type <> 'None'
+AND c.Coverage = code
+AND p.Type <> 'Section Title'
+AND p.Type <> 'Subsection Title'
+RETURN DISTINCT c.Coverage as coverage_code,
+                x.Map_Type as map_type,
+                m.Term as term
+ORDER BY c.Coverage, x.Map_Type, m.Term
+"""
+
+_Q_CCQ_LIST: Final[str] = """
+MATCH (p:Paragraph)-[r:Maps_To]->(m:Map_Term)
+WHERE r.Map_Type IN ['Non-Covered Peril','Limit of Liability','Property Not Covered']
+AND p.Policy_Form = $policy_form
+WITH DISTINCT r.Map_Type AS mapType, m.Term AS term
+ORDER BY term
+RETURN mapType, collect(term) AS terms
+ORDER BY mapType
+"""
+
+_Q_ALL_PARAGRAPHS: Final[str] = """
+MATCH (p:Paragraph)
+WHERE p.Policy_Form = $policy_form
+AND ($after IS NULL OR p.Paragraph_Number > $after)
+RETURN p.Paragraph_Number AS ParagraphNumber,
+       p.Section AS Section,
+       p.Subsection AS Subsection,
+       p.Text AS Text,
+       p.Page AS Page
+ORDER BY p.Paragraph_Number
+SKIP $offset
+"""
+
+_Q_QUERY_PARAGRAPHS: Final[str] = """
+MATCH (p:Paragraph)
+WHERE p.Policy_Form = $policy_form
+AND (
+    p.Type = 'Policy Title Section'
+    OR toString(p.Paragraph_Number) IN $manually_selected_paragraphs
+    OR EXISTS {
+        MATCH (p)-[:Maps_To]->(m:Map_Term)
+        WHERE m.Term IN $terms
+    }
+)
+AND ($after IS NULL OR p.Paragraph_Number > $after)
+RETURN p.Section AS Section,
+       p.Subsection AS Subsection,
+       p.List_Item AS ListItem,
+       p.Type AS Type,
+       p.Paragraph_Number AS ParagraphNumber,
+       p.Page AS Page,
+       p.Text AS Text
+ORDER BY p.Paragraph_Number
+SKIP $offset
+"""
+
+# Paged variants, used only when the client passes `limit`; without it every matching row is streamed
+_Q_ALL_PARAGRAPHS_PAGE: Final[str] = _Q_ALL_PARAGRAPHS + "LIMIT $limit\n"
+_Q_QUERY_PARAGRAPHS_PAGE: Final[str] = _Q_QUERY_PARAGRAPHS + "LIMIT $limit\n"
+
+# Plain driver from settings, with no startup side effects
+def build_neo4j_driver() -> AsyncDriver:
+    return AsyncGraphDatabase.driver(
+        settings.NEO4J_URI,
+        auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+        max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+        connection_acquisition_timeout=settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+        max_connection_lifetime=settings.NEO4J_MAX_CONNECTION_LIFETIME,
+        max_transaction_retry_time=settings.NEO4J_MAX_TRANSACTION_RETRY_TIME,
+        keep_alive=True
+    )
+
+# One pooled driver per app, created at startup and kept on app.state.
+# Connectivity is verified once; failure aborts startup instead of serving on a dead driver.
+async def create_neo4j_driver() -> AsyncDriver:
+    driver = build_neo4j_driver()
     try:
-        driver = GraphDatabase.driver(uri, auth=(user, password))
-        # Test connection
-        driver.verify_connectivity()
-        return driver
+        await driver.verify_connectivity()
     except Exception as e:
-        logger.error(f"Failed to create Neo4j driver: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Database connection failed: {str(e)}"
+        logger.error(f"Failed to connect to Neo4j: {str(e)}")
+        await driver.close()
+        raise
+    logger.info("Neo4j driver initialized")
+    return driver
+
+# Connectivity probe shared by /health/neo4j and test_neo4j.py; raises on failure
+async def probe(driver: AsyncDriver) -> None:
+    await driver.verify_connectivity()
+    await driver.execute_query("RETURN 1 AS test", database_=_DB, routing_=RoutingControl.READ)
+
+# Property indexes backing the filter predicates used by the routes below; created by create_indexes.py
+INDEXES = [
+    "CREATE INDEX form_number_idx IF NOT EXISTS FOR (n:Form) ON (n.Form_Number)",
+    "CREATE INDEX paragraph_policy_form_idx IF NOT EXISTS FOR (p:Paragraph) ON (p.Policy_Form)",
+    "CREATE INDEX coverage_code_idx IF NOT EXISTS FOR (c:Coverage) ON (c.Coverage)",
+    "CREATE INDEX map_term_idx IF NOT EXISTS FOR (m:Map_Term) ON (m.Term)",
+]
+
+async def ensure_indexes(driver: AsyncDriver) -> int:
+    # Returns the number of statements that failed; each one is attempted independently
+    labels, rel_types = await get_policy_type_schema(driver)
+    indexes = INDEXES + [
+        f"CREATE INDEX IF NOT EXISTS FOR (n:{_quote(label)}) ON (n.Policy_Type)"
+        for label in labels
+    ] + [
+        f"CREATE INDEX IF NOT EXISTS FOR ()-[r:{_quote(rel_type)}]-() ON (r.Policy_Type)"
+        for rel_type in rel_types
+    ]
+    failed = 0
+    for index in indexes:
+        try:
+            await driver.execute_query(index, database_=_DB, routing_=RoutingControl.WRITE)
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to create Neo4j index ({index}): {str(e)}")
+    logger.info(f"Ensured {len(indexes) - failed} of {len(indexes)} Neo4j indexes")
+    return failed
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+# Node labels and relationship types that carry a Policy_Type property, discovered from the schema.
+# Kept in the query cache so newly loaded data is picked up after the TTL or DELETE /cache.
+async def get_policy_type_schema(driver: AsyncDriver) -> Tuple[List[str], List[str]]:
+    async def fetch():
+        label_records = await read_records(driver, _Q_POLICY_TYPE_LABELS)
+        rel_type_records = await read_records(driver, _Q_POLICY_TYPE_REL_TYPES)
+        return (
+            [record["label"] for record in label_records],
+            [record["rel_type"] for record in rel_type_records]
+        )
+
+    return await _cached("policy_type_schema", fetch)
+
+def build_policy_types_query(labels: List[str], rel_types: List[str]) -> Optional[str]:
+    # Scope both branches to the labels and types known to carry Policy_Type instead of scanning the graph
+    branches = []
+    if labels:
+        node_matches = "\n            UNION\n".join(
+            f"""            MATCH (n:{_quote(label)})
+            WHERE n.Policy_Type IS NOT NULL
+            RETURN n.Policy_Type AS Policy_Type"""
+            for label in labels
         )
+        branches.append(f"""
+        CALL {{
+{node_matches}
+        }}
+        RETURN DISTINCT "node" AS entity, Policy_Type
+        LIMIT 25""")
+    if rel_types:
+        types = "|".join(_quote(rel_type) for rel_type in rel_types)
+        branches.append(f"""
+        MATCH ()-[r:{types}]->()
+        WHERE r.Policy_Type IS NOT NULL
+        RETURN DISTINCT "relationship" AS entity, r.Policy_Type AS Policy_Type
+        LIMIT 25""")
+    if not branches:
+        return None
+    return "\n        UNION ALL".join(branches) + "\n        "
+
+# Rebuilt from the cached schema, so it follows the schema's TTL
+async def get_policy_types_query(driver: AsyncDriver) -> Optional[str]:
+    return build_policy_types_query(*await get_policy_type_schema(driver))
+
+# Per-process resources, set up by the app lifespan
+def attach_neo4j(state, driver: AsyncDriver):
+    state.neo4j_driver = driver
+    state.policy_type_batcher = PolicyTypeBatcher(driver)
+    state.coverage_terms_batcher = CoverageTermsBatcher(driver)
+
+_app_state_lock = asyncio.Lock()
+
+async def _app_state(request: Request, name: str):
+    state = request.app.state
+    value = getattr(state, name, None)
+    if value is None:
+        # Serverless runtimes (e.g. Vercel) may skip lifespan events; build the driver on first use
+        # instead. It is not verified here, so connection errors surface on the first query.
+        async with _app_state_lock:
+            if getattr(state, "neo4j_driver", None) is None:
+                logger.warning("Lifespan did not initialize Neo4j; creating the driver lazily")
+                attach_neo4j(state, build_neo4j_driver())
+        value = getattr(state, name)
+    return value
+
+async def get_neo4j_driver(request: Request) -> AsyncDriver:
+    return await _app_state(request, "neo4j_driver")
+
+async def read_records(driver: AsyncDriver, query: str, **params) -> List[Dict[str, Any]]:
+    # The driver manages the session and retries; READ routing lets clusters serve it from followers.
+    # Rows come back as plain dicts keyed by the RETURN aliases.
+    return await driver.execute_query(
+        query,
+        params,
+        database_=_DB,
+        routing_=RoutingControl.READ,
+        result_transformer_=AsyncResult.data
+    )
 
-def get_neo4j_session():
-    driver = get_neo4j_driver()
+def stream_json_array(session, result) -> StreamingResponse:
+    # Encode records as they arrive from the cursor instead of building the whole list first
+    async def generate():
+        try:
+            yield b"["
+            first = True
+            async for record in result:
+                if not first:
+                    yield b","
+                first = False
+                yield orjson.dumps(record.data())
+            yield b"]"
+        except Exception:
+            await session.close()
+            raise
+
+    # The background task runs after the body is sent or the client disconnects, even if the
+    # body iterator was cancelled, so the pooled connection is always returned
+    return StreamingResponse(
+        generate(),
+        media_type="application/json",
+        background=BackgroundTask(session.close)
+    )
+
+async def stream_records(driver: AsyncDriver, query: str, **params) -> StreamingResponse:
+    # The session outlives the handler, so it is closed by the stream rather than a dependency
+    session = driver.session(database=_DB, default_access_mode=READ_ACCESS)
     try:
-        session = driver.session(database=os.getenv("NEO4J_DATABASE", "neo4j"))
-        yield session
+        result = await session.run(query, params)
+        # Surface query errors before the response starts
+        await result.peek()
+    except Exception:
+        await session.close()
+        raise
+    return stream_json_array(session, result)
+
+# Reference data changes rarely, so query results are cached per key with a TTL
+_cache: TTLCache = TTLCache(maxsize=settings.GRAPH_CACHE_MAXSIZE, ttl=settings.GRAPH_CACHE_TTL)
+_cache_locks: Dict[Any, asyncio.Lock] = {}
+_MISSING = object()
+
+async def _cached(key, fetch: Callable[[], Awaitable[Any]]):
+    value = _cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    # One fetch per key at a time; concurrent misses wait and reuse the result
+    lock = _cache_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            value = _cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = await fetch()
+                # None means not found; skip caching it so newly imported data shows up immediately
+                if value is not None:
+                    _cache[key] = value
+            return value
     finally:
-        session.close()
-        driver.close()
+        if _cache_locks.get(key) is lock:
+            del _cache_locks[key]
 
 class QueryRequest(BaseModel):
     terms: List[str]
     policy_form: str = "HO00030511"
     manually_selected_paragraphs: Optional[List[int]] = None
 
-@router.get("/forms", response_model=List[Dict[str, Any]])
-async def get_forms(neo4j = Depends(get_neo4j_session)):
+class CoverageTermsBatchRequest(BaseModel):
+    form_number: str
+    coverage_codes: List[str]
+
+# Response models: FastAPI serializes these through pydantic-core instead of walking plain dicts
+class Form(BaseModel):
+    State: Optional[str] = None
+    Form_Type: Optional[str] = None
+    Form_Name: Optional[str] = None
+    Form_Number: Optional[str] = None
+
+class PolicyType(BaseModel):
+    entity: str
+    policy_type: Optional[str] = None
+
+class Coverage(BaseModel):
+    coverage: Optional[str] = None
+    cov_for: Optional[str] = None
+    description: Optional[str] = None
+
+class FormCoverage(BaseModel):
+    coverage_code: Optional[str] = None
+    coverage_name: Optional[str] = None
+
+class FormSummary(BaseModel):
+    policy_type: Optional[str] = None
+    coverages: List[FormCoverage]
+
+class CoverageTerm(BaseModel):
+    coverage_code: Optional[str] = None
+    map_type: Optional[str] = None
+    term: Optional[str] = None
+
+class FormBundle(BaseModel):
+    policy_type: Optional[str] = None
+    coverages: List[FormCoverage]
+    ccq: Dict[str, List[str]]
+
+# Single-key lookups issued concurrently are coalesced into one UNWIND query per batch
+class PolicyTypeBatcher(AsyncBatcher[str, Optional[str]]):
+    def __init__(self, driver: AsyncDriver):
+        super().__init__(
+            max_batch_size=settings.GRAPH_BATCH_MAX_SIZE,
+            max_queue_time=settings.GRAPH_BATCH_MAX_QUEUE_TIME
+        )
+        self.driver = driver
+
+    async def process_batch(self, batch: List[str]) -> List[Optional[str]]:
+        records = await read_records(self.driver, _Q_FORM_POLICY_TYPES_BATCH, form_numbers=batch)
+        policy_types = {record["form_number"]: record["policy_type"] for record in records}
+        return [policy_types.get(form_number) for form_number in batch]
+
+class CoverageTermsBatcher(AsyncBatcher[Tuple[str, str, int, Optional[int]], List[Dict[str, Any]]]):
+    # Items are (form_number, coverage_code, offset, limit)
+    def __init__(self, driver: AsyncDriver):
+        super().__init__(
+            max_batch_size=settings.GRAPH_BATCH_MAX_SIZE,
+            max_queue_time=settings.GRAPH_BATCH_MAX_QUEUE_TIME
+        )
+        self.driver = driver
+
+    async def process_batch(
+        self,
+        batch: List[Tuple[str, str, int, Optional[int]]]
+    ) -> List[List[Dict[str, Any]]]:
+        # Keys sharing a page window go in one query so SKIP/LIMIT stays inside Cypher
+        pages: Dict[Tuple[int, Optional[int]], List[Dict[str, Any]]] = {}
+        for i, (form_number, coverage_code, offset, limit) in enumerate(batch):
+            pages.setdefault((offset, limit), []).append(
+                {"id": i, "form_number": form_number, "coverage_code": coverage_code}
+            )
+
+        results = await asyncio.gather(*(
+            read_records(
+                self.driver,
+                _Q_COVERAGE_TERMS_KEYED if limit is None else _Q_COVERAGE_TERMS_KEYED_PAGE,
+                keys=keys,
+                offset=offset,
+                limit=limit
+            )
+            for (offset, limit), keys in pages.items()
+        ))
+        terms = {record["id"]: record["terms"] for records in results for record in records}
+        return [terms.get(i, []) for i in range(len(batch))]
+
+async def get_policy_type_batcher(request: Request) -> PolicyTypeBatcher:
+    return await _app_state(request, "policy_type_batcher")
+
+async def get_coverage_terms_batcher(request: Request) -> CoverageTermsBatcher:
+    return await _app_state(request, "coverage_terms_batcher")
+
+# Fetchers shared by the single-purpose routes and /form-bundle
+async def fetch_policy_type(batcher: PolicyTypeBatcher, form_number: str) -> Optional[str]:
+    async def fetch():
+        return await batcher.process(form_number)
+
+    return await _cached(("form_policy_type", form_number), fetch)
+
+async def fetch_form_coverages(driver: AsyncDriver, form_number: str) -> List[FormCoverage]:
+    async def fetch():
+        result = await read_records(driver, _Q_FORM_COVERAGES, form_number=form_number)
+        return [FormCoverage(**record) for record in result]
+
+    return await _cached(("form_coverages", form_number), fetch)
+
+async def fetch_ccq_list(driver: AsyncDriver, policy_form: str) -> Dict[str, List[str]]:
+    result = await read_records(driver, _Q_CCQ_LIST, policy_form=policy_form)
+    # Terms are grouped per map type by the query, already sorted
+    return {record["mapType"]: record["terms"] for record in result}
+
+@router.get("/forms", response_model=List[Form])
+async def get_forms(driver: AsyncDriver = Depends(get_neo4j_driver)):
     try:
         logger.info("Fetching forms from Neo4j...")
-        query = """
-        MATCH (n:Form)
-        WITH n
-        RETURN {
-            State: n.State,
-            Form_Type: n.Form_Type,
-            Form_Name: n.Form_Name,
-            Form_Number: n.Form_Number
-        } as form
-        """
-        
-        result = neo4j.run(query)
-        forms = [record["form"] for record in result]
+        
+        async def fetch():
+            result = await read_records(driver, _Q_FORMS)
+            return [Form(**record) for record in result]
+
+        forms = await _cached("forms", fetch)
         
         if not forms:
             logger.warning("No forms found in the database")
@@ -75,30 +505,22 @@ async def get_forms(neo4j = Depends(get_neo4j_session)):
             detail=f"Failed to fetch forms: {str(e)}"
         )
 
-@router.get("/policy-types", response_model=List[Dict[str, Any]])
-async def get_policy_types(neo4j = Depends(get_neo4j_session)):
+@router.get("/policy-types", response_model=List[PolicyType])
+async def get_policy_types(driver: AsyncDriver = Depends(get_neo4j_driver)):
     try:
         logger.info("Fetching policy types from Neo4j...")
-        query = """
-        MATCH (n) 
-        WHERE n.Policy_Type IS NOT NULL
-        RETURN DISTINCT "node" as entity, n.Policy_Type AS Policy_Type
-        LIMIT 25
-        UNION ALL 
-        MATCH ()-[r]-() 
-        WHERE r.Policy_Type IS NOT NULL
-        RETURN DISTINCT "relationship" AS entity, r.Policy_Type AS Policy_Type
-        LIMIT 25
-        """
-        
-        result = neo4j.run(query)
-        policy_types = [
-            {
-                "entity": record["entity"],
-                "policy_type": record["Policy_Type"]
-            } 
-            for record in result
-        ]
+        
+        async def fetch():
+            query = await get_policy_types_query(driver)
+            if query is None:
+                return []
+            result = await read_records(driver, query)
+            return [
+                PolicyType(entity=record["entity"], policy_type=record["Policy_Type"])
+                for record in result
+            ]
+
+        policy_types = await _cached("policy_types", fetch)
         
         if not policy_types:
             logger.warning("No policy types found in the database")
@@ -114,18 +536,16 @@ async def get_policy_types(neo4j = Depends(get_neo4j_session)):
             detail=f"Failed to fetch policy types: {str(e)}"
         )
 
-@router.get("/coverages", response_model=List[Dict[str, Any]])
-async def get_coverages(neo4j = Depends(get_neo4j_session)):
+@router.get("/coverages", response_model=List[Coverage])
+async def get_coverages(driver: AsyncDriver = Depends(get_neo4j_driver)):
     try:
         logger.info("Fetching coverages from Neo4j...")
-        query = """
-        MATCH (n:Coverage) 
-        RETURN n
-        LIMIT 25
-        """
         
-        result = neo4j.run(query)
-        coverages = [dict(record["n"]) for record in result]
+        async def fetch():
+            result = await read_records(driver, _Q_COVERAGES)
+            return [Coverage(**record) for record in result]
+
+        coverages = await _cached("coverages", fetch)
         
         if not coverages:
             logger.warning("No coverages found in the database")
@@ -142,29 +562,27 @@ async def get_coverages(neo4j = Depends(get_neo4j_session)):
         )
 
 @router.get("/form-policy-type/{form_number}", response_model=Dict[str, str])
-async def get_policy_type_by_form(form_number: str, neo4j = Depends(get_neo4j_session)):
+async def get_policy_type_by_form(
+    form_number: str,
+    batcher: PolicyTypeBatcher = Depends(get_policy_type_batcher)
+):
     try:
         logger.info(f"Fetching policy type for form number: {form_number}")
-        query = """
-        MATCH (f:Form)
-        WHERE f.Form_Number = $form_number
-        RETURN f.Form_Type as policy_type
-        """
         
-        result = neo4j.run(query, form_number=form_number)
-        record = result.single()
+        policy_type = await fetch_policy_type(batcher, form_number)
         
-        if not record:
+        if policy_type is None:
             logger.warning(f"No form found with form number: {form_number}")
             raise HTTPException(
                 status_code=404,
                 detail=f"Form not found with form number: {form_number}"
             )
             
-        policy_type = record["policy_type"]
         logger.info(f"Successfully retrieved policy type: {policy_type}")
         return {"policy_type": policy_type}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to fetch policy type for form {form_number}: {str(e)}")
         raise HTTPException(
@@ -172,25 +590,12 @@ async def get_policy_type_by_form(form_number: str, neo4j = Depends(get_neo4j_se
             detail=f"Failed to fetch policy type: {str(e)}"
         )
 
-@router.get("/form-coverages/{form_number}", response_model=List[Dict[str, str]])
-async def get_coverages_by_form(form_number: str, neo4j = Depends(get_neo4j_session)):
+@router.get("/form-coverages/{form_number}", response_model=List[FormCoverage])
+async def get_coverages_by_form(form_number: str, driver: AsyncDriver = Depends(get_neo4j_driver)):
     try:
         logger.info(f"Fetching coverages for form number: {form_number}")
-        query = """
-        MATCH(p:Paragraph)-[y:Related_Coverage]-(c:Coverage)
-        WHERE p.Policy_Form = $form_number
-        RETURN DISTINCT c.Coverage as coverage_code, c.Cov_For as coverage_name
-        ORDER BY c.Coverage
-        """
-        
-        result = neo4j.run(query, form_number=form_number)
-        coverages = [
-            {
-                "coverage_code": record["coverage_code"],
-                "coverage_name": record["coverage_name"]
-            }
-            for record in result
-        ]
+        
+        coverages = await fetch_form_coverages(driver, form_number)
         
         if not coverages:
             logger.warning(f"No coverages found for form number: {form_number}")
@@ -206,36 +611,82 @@ async def get_coverages_by_form(form_number: str, neo4j = Depends(get_neo4j_sess
             detail=f"Failed to fetch coverages: {str(e)}"
         )
 
-@router.get("/form-coverage-terms/{form_number}/{coverage_code}", response_model=List[Dict[str, str]])
+@router.get("/form/{form_number}/summary", response_model=FormSummary)
+async def get_form_summary(form_number: str, driver: AsyncDriver = Depends(get_neo4j_driver)):
+    try:
+        logger.info(f"Fetching summary for form number: {form_number}")
+        
+        # Policy type and coverages in one round-trip instead of two separate requests
+        records = await read_records(driver, _Q_FORM_SUMMARY, form_number=form_number)
+        
+        if not records:
+            logger.warning(f"No form found with form number: {form_number}")
+            raise HTTPException(
+                status_code=404,
+                detail=f"Form not found with form number: {form_number}"
+            )
+            
+        record = records[0]
+        logger.info(f"Successfully retrieved summary with {len(record['coverages'])} coverages for form {form_number}")
+        return FormSummary(**record)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch summary for form {form_number}: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch form summary: {str(e)}"
+        )
+
+@router.get("/form-bundle/{form_number}", response_model=FormBundle)
+async def get_form_bundle(
+    form_number: str,
+    driver: AsyncDriver = Depends(get_neo4j_driver),
+    batcher: PolicyTypeBatcher = Depends(get_policy_type_batcher)
+):
+    try:
+        logger.info(f"Fetching bundle for form number: {form_number}")
+        
+        # Independent reads run concurrently, so latency is the slowest query rather than the sum
+        policy_type, coverages, ccq = await asyncio.gather(
+            fetch_policy_type(batcher, form_number),
+            fetch_form_coverages(driver, form_number),
+            fetch_ccq_list(driver, form_number)
+        )
+        
+        if policy_type is None:
+            logger.warning(f"No form found with form number: {form_number}")
+            raise HTTPException(
+                status_code=404,
+                detail=f"Form not found with form number: {form_number}"
+            )
+            
+        logger.info(f"Successfully retrieved bundle for form {form_number}")
+        return FormBundle(policy_type=policy_type, coverages=coverages, ccq=ccq)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch bundle for form {form_number}: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch form bundle: {str(e)}"
+        )
+
+@router.get("/form-coverage-terms/{form_number}/{coverage_code}", response_model=List[CoverageTerm])
 async def get_coverage_terms(
     form_number: str,
     coverage_code: str,
-    neo4j = Depends(get_neo4j_session)
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    offset: int = Query(0, ge=0),
+    batcher: CoverageTermsBatcher = Depends(get_coverage_terms_batcher)
 ):
     try:
         logger.info(f"Fetching terms for form {form_number} and coverage {coverage_code}")
-        query = """
-        MATCH (m:Map_Term)-[x:Maps_To]-(p:Paragraph)-[y:Related_Coverage]-(c:Coverage)
-        WHERE p.Policy_Form = $form_number 
-        AND x.Map_Type <> 'None' 
-        AND c.Coverage = $coverage_code
-        AND p.Type <> 'Section Title'
-        AND p.Type <> 'Subsection Title'
-        RETURN DISTINCT c.Coverage as coverage_code, 
-                        x.Map_Type as map_type,
-                        m.Term as term
-        ORDER BY c.Coverage, x.Map_Type, m.Term
-        """
-        
-        result = neo4j.run(query, form_number=form_number, coverage_code=coverage_code)
-        terms = [
-            {
-                "coverage_code": record["coverage_code"],
-                "map_type": record["map_type"],
-                "term": record["term"]
-            }
-            for record in result
-        ]
+        
+        result = await batcher.process((form_number, coverage_code, offset, limit))
+        terms = [CoverageTerm(**record) for record in result]
         
         if not terms:
             logger.warning(f"No terms found for form {form_number} and coverage {coverage_code}")
@@ -251,31 +702,46 @@ async def get_coverage_terms(
             detail=f"Failed to fetch coverage terms: {str(e)}"
         )
 
+@router.post("/form-coverage-terms-batch", response_model=Dict[str, List[CoverageTerm]])
+async def get_coverage_terms_batch(
+    request: CoverageTermsBatchRequest,
+    driver: AsyncDriver = Depends(get_neo4j_driver)
+):
+    try:
+        logger.info(f"Fetching terms for form {request.form_number} and {len(request.coverage_codes)} coverages")
+        
+        # One UNWIND query for all coverages instead of one request per coverage
+        result = await read_records(
+            driver,
+            _Q_COVERAGE_TERMS_BATCH,
+            form_number=request.form_number,
+            coverage_codes=request.coverage_codes
+        )
+        
+        # Group terms by coverage code, keeping an entry for every requested coverage
+        terms: Dict[str, List[CoverageTerm]] = {coverage_code: [] for coverage_code in request.coverage_codes}
+        for record in result:
+            terms[record["coverage_code"]].append(CoverageTerm(**record))
+            
+        logger.info(f"Successfully retrieved {len(result)} terms for form {request.form_number}")
+        return terms
+        
+    except Exception as e:
+        logger.error(f"Failed to fetch terms for form {request.form_number}: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch coverage terms: {str(e)}"
+        )
+
 @router.get("/ccq-list", response_model=Dict[str, List[str]])
 async def get_ccq_list(
     policy_form: str = "HO00030511",
-    neo4j = Depends(get_neo4j_session)
+    driver: AsyncDriver = Depends(get_neo4j_driver)
 ):
     try:
         logger.info(f"Fetching CCQ list for policy form: {policy_form}")
-        query = """
-        MATCH (p:Paragraph)-[r:Maps_To]->(m:Map_Term)
-        WHERE r.Map_Type IN ['Non-Covered Peril','Limit of Liability','Property Not Covered'] 
-        AND p.Policy_Form = $policy_form
-        RETURN DISTINCT r.Map_Type as mapType, m.Term AS term
-        ORDER BY term
-        """
-        
-        result = neo4j.run(query, policy_form=policy_form)
-        
-        # Build a grouped object, with keys as map types and values as arrays of terms
-        groups = {}
-        for record in result:
-            map_type = record["mapType"]
-            term = record["term"]
-            if map_type not in groups:
-                groups[map_type] = []
-            groups[map_type].append(term)
+        
+        groups = await fetch_ccq_list(driver, policy_form)
             
         logger.info(f"Successfully retrieved CCQ list with {len(groups)} map types")
         return groups
@@ -290,35 +756,26 @@ async def get_ccq_list(
 @router.get("/all-paragraphs", response_model=List[Dict[str, Any]])
 async def get_all_paragraphs(
     policy_form: str = "HO00030511",
-    neo4j = Depends(get_neo4j_session)
+    after: Optional[int] = None,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    driver: AsyncDriver = Depends(get_neo4j_driver)
 ):
     try:
         logger.info(f"Fetching all paragraphs for policy form: {policy_form}")
-        query = """
-        MATCH (p:Paragraph)
-        WHERE p.Policy_Form = $policy_form
-        RETURN p.Paragraph_Number AS ParagraphNumber,
-               p.Section AS Section,
-               p.Subsection AS Subsection,
-               p.Text AS Text,
-               p.Page AS Page
-        ORDER BY p.Paragraph_Number
-        """
-        
-        result = neo4j.run(query, policy_form=policy_form)
-        paragraphs = [
-            {
-                "ParagraphNumber": record["ParagraphNumber"],
-                "Section": record["Section"],
-                "Subsection": record["Subsection"],
-                "Text": record["Text"],
-                "Page": record["Page"]
-            }
-            for record in result
-        ]
-        
-        logger.info(f"Successfully retrieved {len(paragraphs)} paragraphs")
-        return paragraphs
+        
+        # Pass the last ParagraphNumber seen as `after` to fetch the next page
+        response = await stream_records(
+            driver,
+            _Q_ALL_PARAGRAPHS if limit is None else _Q_ALL_PARAGRAPHS_PAGE,
+            policy_form=policy_form,
+            after=after,
+            offset=offset,
+            limit=limit
+        )
+        
+        logger.info(f"Streaming paragraphs for policy form: {policy_form}")
+        return response
         
     except Exception as e:
         logger.error(f"Failed to fetch all paragraphs: {str(e)}")
@@ -330,57 +787,45 @@ async def get_all_paragraphs(
 @router.post("/query", response_model=List[Dict[str, Any]])
 async def query_paragraphs(
     request: QueryRequest,
-    neo4j = Depends(get_neo4j_session)
+    after: Optional[int] = None,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    driver: AsyncDriver = Depends(get_neo4j_driver)
 ):
     try:
         logger.info(f"Querying paragraphs for terms: {request.terms} in policy form: {request.policy_form}")
         # Convert paragraph numbers to strings if they exist
         paragraph_numbers = [str(num) for num in (request.manually_selected_paragraphs or [])]
         
-        query = """
-        MATCH (p:Paragraph)
-        WHERE p.Policy_Form = $policy_form 
-        AND (
-            (EXISTS((p)-[:Maps_To]->(:Map_Term)) AND ANY(term IN $terms WHERE EXISTS((p)-[:Maps_To]->(:Map_Term {Term: term}))))
-            OR p.Type = 'Policy Title Section'
-            OR toString(p.Paragraph_Number) IN $manually_selected_paragraphs
-        )
-        RETURN DISTINCT p.Section AS Section,
-               p.Subsection AS Subsection,
-               p.List_Item AS ListItem,
-               p.Type AS Type,
-               p.Paragraph_Number AS ParagraphNumber,
-               p.Page AS Page,
-               p.Text AS Text
-        ORDER BY p.Paragraph_Number
-        """
-        
-        result = neo4j.run(
-            query,
+        response = await stream_records(
+            driver,
+            _Q_QUERY_PARAGRAPHS if limit is None else _Q_QUERY_PARAGRAPHS_PAGE,
             policy_form=request.policy_form,
             terms=request.terms,
-            manually_selected_paragraphs=paragraph_numbers
+            manually_selected_paragraphs=paragraph_numbers,
+            after=after,
+            offset=offset,
+            limit=limit
         )
         
-        paragraphs = [
-            {
-                "Section": record["Section"],
-                "Subsection": record["Subsection"],
-                "ListItem": record["ListItem"],
-                "Type": record["Type"],
-                "ParagraphNumber": record["ParagraphNumber"],
-                "Page": record["Page"],
-                "Text": record["Text"]
-            }
-            for record in result
-        ]
-        
-        logger.info(f"Successfully retrieved {len(paragraphs)} paragraphs for query")
-        return paragraphs
+        logger.info(f"Streaming paragraphs for query in policy form: {request.policy_form}")
+        return response
         
     except Exception as e:
         logger.error(f"Failed to execute query: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail=f"Failed to execute query: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    if not settings.GRAPH_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin routes are disabled")
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, settings.GRAPH_ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+@router.delete("/cache", dependencies=[Depends(require_admin_token)])
+async def clear_cache():
+    _cache.clear()
+    logger.info("Graph query cache cleared")
+    return {"status": "cleared"}
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+import asyncio
+from typing import Generic, List, Optional, Set, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+class AsyncBatcher(ABC, Generic[K, V]):
+    # Coalesces concurrent process() calls made within a short window into one process_batch() call.
+    # Subclasses implement process_batch, returning one result per item in the same order.
+    def __init__(self, max_batch_size: int = 64, max_queue_time: float = 0.005):
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: List[Tuple[K, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    @abstractmethod
+    async def process_batch(self, batch: List[K]) -> List[V]:
+        ...
+
+    async def process(self, item: K) -> V:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[K, asyncio.Future]]):
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.config.settings import settings
+from app.routers import graph
+
+# One-off migration: creates the indexes the API relies on. Safe to re-run (IF NOT EXISTS).
+async def main():
+    if not all([settings.NEO4J_URI, settings.NEO4J_USER, settings.NEO4J_PASSWORD]):
+        print("Error: NEO4J_URI, NEO4J_USER and NEO4J_PASSWORD must be set in .env file")
+        return 1
+
+    driver = graph.build_neo4j_driver()
+    try:
+        await driver.verify_connectivity()
+        failed = await graph.ensure_indexes(driver)
+        return 1 if failed else 0
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        return 1
+    finally:
+        await driver.close()
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main()))